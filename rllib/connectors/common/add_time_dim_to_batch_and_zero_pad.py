@@ -14,7 +14,7 @@ from ray.rllib.utils.postprocessing.zero_padding import (
     create_mask_and_seq_lens,
     split_and_zero_pad,
 )
-from ray.rllib.utils.spaces.space_utils import BatchedNdArray
+from ray.rllib.utils.spaces.space_utils import is_batched, mark_batched
 from ray.rllib.utils.typing import EpisodeType
 from ray.util.annotations import PublicAPI
 
@@ -203,8 +203,10 @@ class AddTimeDimToBatchAndZeroPad(ConnectorV2):
                         # Expand on axis 0 (the to-be-time-dim) if item has not been
                         # batched yet, otherwise axis=1 (the time-dim).
                         else tree.map_structure(
-                            lambda s: np.expand_dims(
-                                s, axis=(1 if isinstance(s, BatchedNdArray) else 0)
+                            lambda s: (
+                                mark_batched(np.expand_dims(s, axis=1))
+                                if is_batched(s)
+                                else np.expand_dims(s, axis=0)
                             ),
                             item,
                         )
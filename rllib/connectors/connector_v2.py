@@ -22,7 +22,7 @@ from ray.rllib.utils import force_list
 from ray.rllib.utils.annotations import override, OverrideToImplementCustomLogic
 from ray.rllib.utils.checkpoints import Checkpointable
 from ray.rllib.utils.metrics.metrics_logger import MetricsLogger
-from ray.rllib.utils.spaces.space_utils import BatchedNdArray
+from ray.rllib.utils.spaces.space_utils import mark_batched
 from ray.rllib.utils.typing import AgentID, EpisodeType, ModuleID, StateDict
 from ray.util.annotations import PublicAPI
 
@@ -710,13 +710,13 @@ class ConnectorV2(Checkpointable, abc.ABC):
         # (eps_id, agent_id, module_id)-tuple key, we need to concatenate, not stack
         # the items in there.
         def _tag(s):
-            return BatchedNdArray(s)
+            return mark_batched(s)
 
         ConnectorV2.add_batch_item(
             batch=batch,
             column=column,
-            # Convert given input into BatchedNdArray(s) such that the `batch` utility
-            # knows that it'll have to concat, not stack.
+            # Mark given input as batched (see `mark_batched()`) such that the `batch`
+            # utility knows that it'll have to concat, not stack.
             item_to_add=tree.map_structure(_tag, items_to_add),
             single_agent_episode=single_agent_episode,
         )
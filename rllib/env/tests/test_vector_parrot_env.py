@@ -0,0 +1,58 @@
+import unittest
+
+import gymnasium as gym
+import numpy as np
+
+from ray.rllib.examples.envs.classes.vector_parrot_env import VectorParrotEnv
+from ray.rllib.utils.test_utils import check
+
+
+class TestVectorParrotEnv(unittest.TestCase):
+    def test_reset_and_step(self):
+        """Tests rewards, episode lengths, and next-step autoresets."""
+        env = VectorParrotEnv(num_envs=3)
+        obs, _ = env.reset(seed=42)
+        self.assertEqual(obs.shape, (3, 1))
+        self.assertTrue(env.observation_space.contains(obs))
+
+        for t in range(12):
+            # Repeat the observations in all but the first sub-env.
+            actions = obs.copy()
+            actions[0] = 0.0
+            prev_obs = obs
+            obs, rewards, terminated, truncated, _ = env.step(actions)
+            # Returned observations must never be re-used buffers.
+            self.assertIsNot(obs, prev_obs)
+            self.assertTrue(env.observation_space.contains(obs))
+            if t == 10:
+                # Autoreset step: All rewards are 0.0.
+                check(rewards, [0.0, 0.0, 0.0])
+            else:
+                check(rewards, [-abs(prev_obs[0, 0]), 0.0, 0.0], decimals=5)
+            check(terminated, [t == 9] * 3)
+            check(truncated, terminated)
+
+    def test_seeding(self):
+        obs_a, _ = VectorParrotEnv(num_envs=4).reset(seed=1)
+        obs_b, _ = VectorParrotEnv(num_envs=4).reset(seed=1)
+        check(obs_a, obs_b)
+
+    def test_other_spaces(self):
+        """Tests unbounded and integer Box spaces."""
+        for space in [
+            gym.spaces.Box(-np.inf, np.inf, (2,), np.float32),
+            gym.spaces.Box(-5, 5, (2,), np.int32),
+        ]:
+            env = VectorParrotEnv(num_envs=2, config={"parrot_shriek_range": space})
+            obs, _ = env.reset(seed=0)
+            self.assertTrue(np.all(np.isfinite(obs)))
+            self.assertTrue(env.observation_space.contains(obs))
+            obs, rewards, _, _, _ = env.step(obs)
+            check(rewards, [0.0, 0.0])
+
+
+if __name__ == "__main__":
+    import pytest
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
@@ -0,0 +1,116 @@
+import gymnasium as gym
+import numpy as np
+
+from ray.rllib.utils.spaces.space_utils import get_dummy_batch_for_space
+
+
+class VectorParrotEnv(gym.vector.VectorEnv):
+    """Natively vectorized version of the "ParrotEnv" (see RLlib's README example).
+
+    In each of the `num_envs` sub-environments, the agent must learn to repeat the
+    seen observations. Observations are float numbers indicating the to-be-repeated
+    values, e.g. -1.0, 5.1, or 3.2. The action space is always the same as the
+    observation space. Rewards are r=-abs(observation - action), for all steps.
+    Episodes are terminated (and truncated) after 10 steps.
+
+    Instead of holding `num_envs` individual ParrotEnv objects (and stepping
+    through these one by one in python), the state of all sub-environments is
+    stored in a struct-of-arrays layout, such that each `step()` only performs a
+    handful of numpy calls over all sub-environments at once.
+
+    Sub-environments that are done are reset automatically with the next call to
+    `step()` (gymnasium's "next-step" autoreset mode).
+
+    .. testcode::
+
+        import gymnasium as gym
+        import numpy as np
+
+        from ray.rllib.examples.envs.classes.vector_parrot_env import (
+            VectorParrotEnv
+        )
+
+        env = VectorParrotEnv(num_envs=4)
+        obs, infos = env.reset(seed=42)
+        assert obs.shape == (4, 1)
+
+        # Perfectly repeat the observations -> rewards are all 0.0.
+        obs, rewards, terminated, truncated, infos = env.step(obs)
+        assert np.all(rewards == 0.0)
+    """
+
+    def __init__(self, num_envs: int = 1, config=None):
+        config = config or {}
+        self.num_envs = num_envs
+        # Make the space (for actions and observations) configurable.
+        self.single_action_space = config.get(
+            "parrot_shriek_range", gym.spaces.Box(-1.0, 1.0, (1,), np.float32)
+        )
+        # Since actions should repeat observations, their spaces must be the
+        # same.
+        self.single_observation_space = self.single_action_space
+        self.action_space = gym.vector.utils.batch_space(
+            self.single_action_space, self.num_envs
+        )
+        self.observation_space = gym.vector.utils.batch_space(
+            self.single_observation_space, self.num_envs
+        )
+
+        # The (struct-of-arrays) state of all sub-environments.
+        self._cur_obs = None
+        self._episode_len = np.zeros((self.num_envs,), dtype=np.int32)
+        # Which sub-environments have to be reset at the next `step()` call.
+        self._autoreset_envs = np.zeros((self.num_envs,), dtype=np.bool_)
+        # Pre-allocated buffer to compute the rewards in (w/o any new allocations).
+        self._diff = np.empty(
+            (self.num_envs,) + self.single_observation_space.shape,
+            dtype=self.single_observation_space.dtype,
+        )
+
+    def reset(self, *, seed=None, options=None):
+        """Resets all sub-environments and returns their initial observations."""
+        super().reset(seed=seed, options=options)
+        # New observations are drawn from the observation space's own RNG.
+        if seed is not None:
+            self.single_observation_space.seed(seed)
+        self._episode_len[:] = 0
+        self._autoreset_envs[:] = False
+        self._cur_obs = self._sample_observations()
+        return self._cur_obs, {}
+
+    def step(self, actions):
+        """Takes a single step in all sub-environments given `actions`.
+
+        Returns: New observations, rewards, terminated- and truncated-flags, and
+        an (empty) info-dict.
+        """
+        # r = -abs(obs - action), summed up over all (non-batch) observation dims.
+        np.subtract(self._cur_obs, actions, out=self._diff)
+        np.abs(self._diff, out=self._diff)
+        rewards = -self._diff.reshape(self.num_envs, -1).sum(axis=1)
+        self._episode_len += 1
+
+        # Sub-environments that were done in the previous step get reset now:
+        # These ignore their `actions`, return an initial observation, and a reward
+        # of 0.0.
+        rewards[self._autoreset_envs] = 0.0
+        self._episode_len[self._autoreset_envs] = 0
+
+        # Set `terminated` and `truncated` flags to True after 10 steps.
+        terminated = self._episode_len >= 10
+        truncated = terminated.copy()
+        self._autoreset_envs = terminated.copy()
+
+        # Set new observations (random samples). Note that these must be a new array
+        # (no re-used buffer) as RLlib keeps references to all returned observations.
+        self._cur_obs = self._sample_observations()
+        return self._cur_obs, rewards, terminated, truncated, {}
+
+    def _sample_observations(self):
+        # Draws a new batch of observations from our observation space (for bounded
+        # float Boxes, all at once with a single in-place RNG fill).
+        return get_dummy_batch_for_space(
+            self.single_observation_space,
+            batch_size=self.num_envs,
+            fill_value="random",
+        )
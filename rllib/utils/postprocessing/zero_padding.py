@@ -4,7 +4,7 @@ from typing import List, Tuple, Union
 import numpy as np
 import tree  # pip install dm_tree
 
-from ray.rllib.utils.spaces.space_utils import batch, BatchedNdArray
+from ray.rllib.utils.spaces.space_utils import batch, is_batched, mark_batched
 from ray.util.annotations import DeveloperAPI
 
 
@@ -48,7 +48,7 @@ def create_mask_and_seq_lens(episode_len: int, T: int) -> Tuple[List, List]:
 
 @DeveloperAPI
 def split_and_zero_pad(
-    item_list: List[Union[BatchedNdArray, np._typing.NDArray, float]],
+    item_list: List[Union[np._typing.NDArray, float]],
     max_seq_len: int,
 ) -> List[np._typing.NDArray]:
     """Splits the contents of `item_list` into a new list of ndarrays and returns it.
@@ -57,16 +57,14 @@ def split_and_zero_pad(
     The last item in the returned list may be (right) zero-padded, if necessary, to
     reach `max_seq_len`.
 
-    If `item_list` contains one or more `BatchedNdArray` (instead of individual
-    items), these will be split accordingly along their axis=0 to yield the returned
-    structure described above.
+    If `item_list` contains one or more batched ndarrays (instead of individual
+    items; see `mark_batched()`), these will be split accordingly along their axis=0
+    to yield the returned structure described above.
 
     .. testcode::
 
-        from ray.rllib.utils.postprocessing.zero_padding import (
-            BatchedNdArray,
-            split_and_zero_pad,
-        )
+        from ray.rllib.utils.postprocessing.zero_padding import split_and_zero_pad
+        from ray.rllib.utils.spaces.space_utils import mark_batched
         from ray.rllib.utils.test_utils import check
 
         # Simple case: `item_list` contains individual floats.
@@ -75,19 +73,19 @@ def split_and_zero_pad(
             [[0, 1, 2, 3, 4], [5, 6, 7, 0, 0]],
         )
 
-        # `item_list` contains BatchedNdArray (ndarrays that explicitly declare they
-        # have a batch axis=0).
+        # `item_list` contains batched ndarrays (ndarrays that are explicitly marked
+        # to have a batch axis=0).
         check(
             split_and_zero_pad([
-                BatchedNdArray([0, 1]),
-                BatchedNdArray([2, 3, 4, 5]),
-                BatchedNdArray([6, 7, 8]),
+                mark_batched([0, 1]),
+                mark_batched([2, 3, 4, 5]),
+                mark_batched([6, 7, 8]),
             ], 5),
             [[0, 1, 2, 3, 4], [5, 6, 7, 8, 0]],
         )
 
     Args:
-        item_list: A list of individual items or BatchedNdArrays to be split into
+        item_list: A list of individual items or batched ndarrays to be split into
             `max_seq_len` long pieces (the last of which may be zero-padded).
         max_seq_len: The maximum length of each item in the returned list.
 
@@ -97,7 +95,7 @@ def split_and_zero_pad(
         The last item in the returned list may be zero-padded, if necessary.
     """
     zero_element = tree.map_structure(
-        lambda s: np.zeros_like([s[0]] if isinstance(s, BatchedNdArray) else s),
+        lambda s: np.zeros_like([s[0]] if is_batched(s) else s),
         item_list[0],
     )
 
@@ -115,14 +113,14 @@ def split_and_zero_pad(
     while len(item_list) > 0:
         item = item_list.popleft()
         # `item` is already a batched np.array: Split if necessary.
-        if isinstance(item, BatchedNdArray):
+        if is_batched(item):
             t = max_seq_len - current_t
-            current_time_row.append(item[:t])
+            current_time_row.append(mark_batched(item[:t]))
             if len(item) <= t:
                 current_t += len(item)
             else:
                 current_t += t
-                item_list.appendleft(item[t:])
+                item_list.appendleft(mark_batched(item[t:]))
         # `item` is a single item (no batch axis): Append and continue with next item.
         else:
             current_time_row.append(item)
@@ -158,7 +156,7 @@ def split_and_zero_pad_n_episodes(nd_array, episode_lens, max_seq_len):
     cursor = 0
     for episode_len in episode_lens:
         # episode_item_list = []
-        items = BatchedNdArray(nd_array[cursor : cursor + episode_len])
+        items = mark_batched(nd_array[cursor : cursor + episode_len])
         # episode_item_list.append(items)
         ret.extend(split_and_zero_pad([items], max_seq_len))
         cursor += episode_len
@@ -1,10 +1,15 @@
 import gymnasium as gym
 from gymnasium.spaces import Tuple, Dict
 from gymnasium.core import ActType, ObsType
+import functools
 import numpy as np
+import operator
+import weakref
 from ray.rllib.utils.annotations import DeveloperAPI
+from ray.rllib.utils.deprecation import deprecation_warning
+from ray.util import log_once
 import tree  # pip install dm_tree
-from typing import Any, List, Optional, Union
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Union
 
 
 @DeveloperAPI
@@ -16,21 +21,71 @@ class BatchedNdArray(np.ndarray):
     concatenate n already batched items (each one possibly with a different batch
     dim, but definitely with some batch dim).
 
-    TODO (sven): Maybe replace this by a list-override instead.
+    Deprecated: Use `mark_batched()` and `is_batched()` instead, which work on plain
+    ndarrays (w/o any subclass overhead on numpy ops).
     """
 
     def __new__(cls, input_array):
+        if log_once("BatchedNdArray"):
+            deprecation_warning(
+                old="ray.rllib.utils.spaces.space_utils.BatchedNdArray",
+                new="ray.rllib.utils.spaces.space_utils.mark_batched",
+                error=False,
+            )
         # Use __new__ to create a new instance of our subclass.
         obj = np.asarray(input_array).view(cls)
         return obj
 
 
+# All ndarrays currently marked as having a batch dim (see `mark_batched()`), keyed
+# by their ids. Entries vanish automatically once their array is garbage collected.
+_BATCHED_NDARRAYS = weakref.WeakValueDictionary()
+
+
+@DeveloperAPI
+def mark_batched(input_array: Any) -> np.ndarray:
+    """Returns a plain ndarray view onto `input_array`, marked as having a batch dim.
+
+    This is such that our `batch()` utility can distinguish between having to
+    stack n individual batch items (each one w/o any batch dim) vs having to
+    concatenate n already batched items (each one possibly with a different batch
+    dim, but definitely with some batch dim).
+
+    Note that the mark does not carry over to other arrays derived from the returned
+    one (e.g. slices or results of numpy ops). Call `mark_batched()` on these again,
+    if they should be concatenated as well.
+
+    Args:
+        input_array: The array (or array-like) that has a batch dim (axis=0).
+
+    Returns:
+        A new ndarray view onto `input_array`, for which `is_batched()` returns True.
+    """
+    arr = np.asarray(input_array).view(np.ndarray)
+    _BATCHED_NDARRAYS[id(arr)] = arr
+    return arr
+
+
+@DeveloperAPI
+def is_batched(item: Any) -> bool:
+    """Returns True, if `item` has been marked as having a batch dim.
+
+    Args:
+        item: The item to check.
+
+    Returns:
+        True, if `item` has been returned by `mark_batched()` (or is a deprecated
+        `BatchedNdArray`), otherwise False.
+    """
+    return _BATCHED_NDARRAYS.get(id(item)) is item or isinstance(item, BatchedNdArray)
+
+
 @DeveloperAPI
 def get_original_space(space: gym.Space) -> gym.Space:
     """Returns the original space of a space, if any.
 
-    This function recursively traverses the given space and returns the original space
-    at the very end of the chain.
+    This function traverses the chain of `original_space` attributes of the given
+    space and returns the original space at the very end of the chain.
 
     Args:
         space: The space to get the original space for.
@@ -38,10 +93,20 @@ def get_original_space(space: gym.Space) -> gym.Space:
     Returns:
         The original space or the given space itself if no original space is found.
     """
-    if hasattr(space, "original_space"):
-        return get_original_space(space.original_space)
-    else:
-        return space
+    while hasattr(space, "original_space"):
+        space = space.original_space
+    return space
+
+
+# All `gymnasium` space types, which hold other spaces (see `is_composite_space()`).
+_COMPOSITE_SPACE_TYPES = frozenset(
+    [
+        gym.spaces.Dict,
+        gym.spaces.Graph,
+        gym.spaces.Sequence,
+        gym.spaces.Tuple,
+    ]
+)
 
 
 @DeveloperAPI
@@ -57,15 +122,7 @@ def is_composite_space(space: gym.Space) -> bool:
     Returns:
         True, if the space is composed of other spaces, otherwise False.
     """
-    if type(space) in [
-        gym.spaces.Dict,
-        gym.spaces.Graph,
-        gym.spaces.Sequence,
-        gym.spaces.Tuple,
-    ]:
-        return True
-    else:
-        return False
+    return type(space) in _COMPOSITE_SPACE_TYPES
 
 
 @DeveloperAPI
@@ -86,12 +143,82 @@ def to_jsonable_if_needed(
         composite sample to a JSONable data type.
     """
 
-    if is_composite_space(space):
+    # Dict- and Tuple spaces: Use the (cached) conversion function for this space,
+    # instead of walking through all of the space's sub-spaces again.
+    if type(space) in (gym.spaces.Dict, gym.spaces.Tuple):
+        return _get_to_jsonable_fn(space)(sample)
+    elif is_composite_space(space):
         return space.to_jsonable([sample])
     else:
         return sample
 
 
+# Maps `id(space)` to a tuple of (weakref to the space, the space's to-jsonable
+# function, snapshot of all Dict spaces within the space). See
+# `_get_to_jsonable_fn()`.
+_TO_JSONABLE_FNS = {}
+
+
+def _get_to_jsonable_fn(space: gym.Space) -> Callable[[Any], Any]:
+    # Note that gymnasium spaces are unhashable (they define `__eq__`) and the
+    # returned function can't be stored on the space itself (spaces must remain
+    # picklable), hence the `id`-keyed registry.
+    key = id(space)
+    entry = _TO_JSONABLE_FNS.get(key)
+    # Only re-use the function, if none of the - mutable - Dict spaces within
+    # `space` has been altered since.
+    if entry is not None and entry[0]() is space and _dict_spaces_unchanged(entry[2]):
+        return entry[1]
+
+    def _remove(ref, key=key):
+        # Only remove the entry, if it hasn't been taken over by a new space
+        # (reusing the same id) in the meantime.
+        if _TO_JSONABLE_FNS.get(key, (None,))[0] is ref:
+            del _TO_JSONABLE_FNS[key]
+
+    dict_spaces = []
+    fn = _build_to_jsonable_fn(space, dict_spaces)
+    # Only refer to `space` itself through a weak proxy, such that its registry
+    # entry doesn't keep it alive.
+    snapshot = _snapshot_dict_spaces(
+        [weakref.proxy(d) if d is space else d for d in dict_spaces]
+    )
+    _TO_JSONABLE_FNS[key] = (weakref.ref(space, _remove), fn, snapshot)
+    return fn
+
+
+def _build_to_jsonable_fn(
+    space: gym.Space, dict_spaces: List[gym.spaces.Dict]
+) -> Callable[[Any], Any]:
+    # Returns a function that produces the same output as
+    # `space.to_jsonable([sample])`, but with all per-space decisions already made.
+    # For Dict- and Tuple spaces, the returned function only holds references to
+    # `space`'s sub-spaces (never to `space` itself).
+    # Note: The directly handled space types below mirror the `to_jsonable()`
+    # implementations in `gymnasium/spaces/{dict,tuple,box,multi_discrete,
+    # multi_binary,discrete}.py` (gymnasium==1.0). When upgrading gymnasium, make
+    # sure these are still in sync (see `test_to_jsonable_if_needed` in
+    # `rllib/utils/spaces/tests/test_space_utils.py`, which compares both outputs).
+    space_type = type(space)
+    if space_type is gym.spaces.Dict:
+        # Collect all Dict spaces (these may be altered after their construction).
+        dict_spaces.append(space)
+        fns = [
+            (k, _build_to_jsonable_fn(s, dict_spaces)) for k, s in space.spaces.items()
+        ]
+        return lambda x: {k: fn(x[k]) for k, fn in fns}
+    elif space_type is gym.spaces.Tuple:
+        fns = [_build_to_jsonable_fn(s, dict_spaces) for s in space.spaces]
+        return lambda x: [fn(x[i]) for i, fn in enumerate(fns)]
+    elif space_type in (gym.spaces.Box, gym.spaces.MultiDiscrete):
+        return lambda x: [x.tolist()]
+    elif space_type is gym.spaces.MultiBinary:
+        return lambda x: np.array([x]).tolist()
+    elif space_type is gym.spaces.Discrete:
+        return lambda x: [int(x)]
+    return lambda x: space.to_jsonable([x])
+
+
 @DeveloperAPI
 def from_jsonable_if_needed(
     sample: Union[ActType, ObsType], space: gym.Space
@@ -131,14 +258,22 @@ def flatten_space(space: gym.Space) -> List[gym.Space]:
         List[gym.Space]: The flattened list of primitive Spaces. This list
             does not contain Tuples or Dicts anymore.
     """
+    from ray.rllib.utils.spaces.flexdict import FlexDict
 
-    def _helper_flatten(space_, return_list):
-        from ray.rllib.utils.spaces.flexdict import FlexDict
+    # Return the cached result, if any (and if none of the - mutable - Dict spaces
+    # within `space` has been altered since).
+    cached = getattr(space, "_rllib_flattened_space", None)
+    if cached is not None and _dict_spaces_unchanged(cached[1]):
+        return list(cached[0])
+
+    dict_spaces = []
 
+    def _helper_flatten(space_, return_list):
         if isinstance(space_, Tuple):
             for s in space_:
                 _helper_flatten(s, return_list)
         elif isinstance(space_, (Dict, FlexDict)):
+            dict_spaces.append(space_)
             for k in sorted(space_.spaces):
                 _helper_flatten(space_[k], return_list)
         else:
@@ -146,9 +281,24 @@ def flatten_space(space: gym.Space) -> List[gym.Space]:
 
     ret = []
     _helper_flatten(space, ret)
+    # Only cache on actual Space objects.
+    if isinstance(space, gym.Space):
+        space._rllib_flattened_space = (tuple(ret), _snapshot_dict_spaces(dict_spaces))
     return ret
 
 
+def _snapshot_dict_spaces(dict_spaces: List[gym.spaces.Dict]) -> tuple:
+    # Returns the current contents of all given Dict spaces. Dict spaces (unlike
+    # Tuple spaces) may be altered after their construction (e.g. via
+    # `__setitem__`), so results cached for a space containing Dicts are only valid
+    # as long as these contents don't change (see `_dict_spaces_unchanged()`).
+    return tuple((d, tuple(d.spaces.items())) for d in dict_spaces)
+
+
+def _dict_spaces_unchanged(snapshot: tuple) -> bool:
+    return all(tuple(d.spaces.items()) == items for d, items in snapshot)
+
+
 @DeveloperAPI
 def get_base_struct_from_space(space):
     """Returns a Tuple/Dict Space as native (equally structured) py tuple/dict.
@@ -172,17 +322,32 @@ def get_base_struct_from_space(space):
     .. testoutput::
 
         dict(a=Box(), b=tuple(Discrete(2), Discrete(3)))
+
+    Note that for Tuple/Dict spaces, the returned struct is cached on (and shared
+    by all callers for) the given space, so it must not be altered.
     """
+    # Return the cached result, if any (and if none of the - mutable - Dict spaces
+    # within `space` has been altered since).
+    cached = getattr(space, "_rllib_base_struct", None)
+    if cached is not None and _dict_spaces_unchanged(cached[1]):
+        return cached[0]
+
+    dict_spaces = []
 
     def _helper_struct(space_):
         if isinstance(space_, Tuple):
             return tuple(_helper_struct(s) for s in space_)
         elif isinstance(space_, Dict):
+            dict_spaces.append(space_)
             return {k: _helper_struct(space_[k]) for k in space_.spaces}
         else:
             return space_
 
-    return _helper_struct(space)
+    ret = _helper_struct(space)
+    # Primitive spaces are returned as-is (nothing to cache).
+    if isinstance(space, (Tuple, Dict)):
+        space._rllib_base_struct = (ret, _snapshot_dict_spaces(dict_spaces))
+    return ret
 
 
 @DeveloperAPI
@@ -245,44 +410,92 @@ def get_dummy_batch_for_space(
         elif isinstance(space, gym.spaces.MultiDiscrete):
             space = gym.spaces.Box(0.0, 1.0, (np.sum(space.nvec),), np.float32)
 
+    # The leading (batch- and time-) dims of the returned batch.
+    if time_size is not None:
+        assert batch_size > 0 and time_size > 0
+        if time_major:
+            shape = [time_size, batch_size]
+        else:
+            shape = [batch_size, time_size]
+    else:
+        shape = [batch_size] if batch_size > 0 else []
+
     # Primivite spaces: Box, Discrete, MultiDiscrete.
     # Random values: Use gym's sample() method.
     if fill_value == "random":
-        if time_size is not None:
-            assert batch_size > 0 and time_size > 0
-            if time_major:
-                return np.array(
-                    [
-                        [space.sample() for _ in range(batch_size)]
-                        for t in range(time_size)
-                    ],
-                    dtype=space.dtype,
-                )
+        # Bounded Box (float and integer) and Discrete spaces: Draw all values at
+        # once from the space's own random number generator (instead of calling
+        # `sample()` for each single item).
+        if (
+            isinstance(space, gym.spaces.Box)
+            and np.issubdtype(space.dtype, np.floating)
+            and space.is_bounded("both")
+        ):
+            out = np.empty(shape + list(space.shape), dtype=space.dtype)
+            # Computed in the space's dtype, this range may overflow (to inf) for
+            # very large (but finite) bounds.
+            with np.errstate(over="ignore"):
+                scale = space.high - space.low
+            # Fill `out` in-place with U[0, 1) values (one RNG call, no float64
+            # intermediate for float32 spaces), then scale and shift these into
+            # [low, high] (clipping away possible rounding errors at the bounds).
+            if out.dtype in (np.float32, np.float64) and np.all(np.isfinite(scale)):
+                space.np_random.random(out=out, dtype=out.dtype)
+                out *= scale
+                out += space.low
+                np.clip(out, space.low, space.high, out=out)
             else:
-                return np.array(
-                    [
-                        [space.sample() for t in range(time_size)]
-                        for _ in range(batch_size)
-                    ],
-                    dtype=space.dtype,
-                )
+                out[...] = space.np_random.uniform(space.low, space.high, out.shape)
+            return out
+        elif (
+            isinstance(space, gym.spaces.Box)
+            and np.issubdtype(space.dtype, np.integer)
+            and space.is_bounded("both")
+        ):
+            # Same (uniform) distribution over [low, high] as `Box.sample()`'s
+            # `floor(uniform(low, high + 1))`, but drawn directly in the space's dtype
+            # (e.g. uint8 for image observations).
+            low, high = space.low, space.high
+            # Pass uniform bounds as scalars, which is much faster than having the
+            # RNG broadcast the (full) bound arrays.
+            if (
+                low.size > 0
+                and np.all(low == low.flat[0])
+                and np.all(high == high.flat[0])
+            ):
+                low, high = low.flat[0], high.flat[0]
+            return space.np_random.integers(
+                low,
+                high,
+                size=shape + list(space.shape),
+                dtype=space.dtype,
+                endpoint=True,
+            )
+        elif isinstance(space, gym.spaces.Discrete):
+            return np.asarray(
+                space.start + space.np_random.integers(space.n, size=shape),
+                dtype=space.dtype,
+            )
+        # All other spaces with a fixed shape: Sample each item individually, but
+        # write the samples directly into the pre-allocated output batch.
+        elif space.shape is not None:
+            out = np.empty(shape + list(space.shape), dtype=space.dtype)
+            for idx in np.ndindex(*shape):
+                out[idx] = space.sample()
+            return out
+        # Spaces w/o a fixed shape (e.g. Text).
         else:
             return np.array(
-                [space.sample() for _ in range(batch_size)]
-                if batch_size > 0
-                else space.sample(),
+                [space.sample() for _ in range(int(np.prod(shape)))],
                 dtype=space.dtype,
-            )
-    # Fill value given: Use np.full.
+            ).reshape(shape)
+    # Fill value given: Use np.zeros or np.full.
     else:
-        if time_size is not None:
-            assert batch_size > 0 and time_size > 0
-            if time_major:
-                shape = [time_size, batch_size]
-            else:
-                shape = [batch_size, time_size]
-        else:
-            shape = [batch_size] if batch_size > 0 else []
+        # Zero-filled (default) dummy batches: `np.zeros` gets its memory already
+        # zeroed (lazily) from the OS, so - unlike `np.full` - doesn't have to
+        # write each single value.
+        if fill_value == 0:
+            return np.zeros(shape + list(space.shape), dtype=space.dtype)
         return np.full(
             shape + list(space.shape), fill_value=fill_value, dtype=space.dtype
         )
@@ -315,13 +528,58 @@ def flatten_to_single_ndarray(input_):
     """
     # Concatenate complex inputs.
     if isinstance(input_, (list, tuple, dict)):
-        expanded = []
-        for in_ in tree.flatten(input_):
-            expanded.append(np.reshape(in_, [-1]))
-        input_ = np.concatenate(expanded, axis=0).flatten()
+        # `np.ravel` returns views for all contiguous leaves and the result of
+        # `np.concatenate` is already a new 1D array -> Only one copy of the data.
+        input_ = np.concatenate([np.ravel(in_) for in_ in tree.flatten(input_)])
     return input_
 
 
+def _get_unflatten_fn(structure: Any) -> Callable[[List[Any]], Any]:
+    """Returns a function packing a flat list of leaves into the shape of `structure`.
+
+    The returned function is equivalent to
+    `lambda flat: tree.unflatten_as(structure, flat)`, but `structure` is only
+    traversed once (here), not on each call. Use this when the same structure has
+    to be re-built many times, e.g. once per batch item in `unbatch()`.
+
+    Args:
+        structure: The (possibly nested) template struct. Leaves are indexed in the
+            same (sorted dict-key) order as the one used by `tree.flatten`.
+
+    Returns:
+        A function taking the flat list of leaves (of length
+        `len(tree.flatten(structure))`) and returning the packed struct.
+    """
+    num_leaves = 0
+
+    def _build(struct):
+        nonlocal num_leaves
+
+        if not tree.is_nested(struct):
+            num_leaves += 1
+            return operator.itemgetter(num_leaves - 1)
+        elif type(struct) is dict:
+            # Leaves are numbered in sorted key order (like `tree.flatten` does),
+            # but the packed dict keeps the key order of the template.
+            fns = {k: _build(struct[k]) for k in sorted(struct)}
+            items = [(k, fns[k]) for k in struct]
+            return lambda flat: {k: fn(flat) for k, fn in items}
+        elif type(struct) is tuple:
+            fns = [_build(s) for s in struct]
+            return lambda flat: tuple([fn(flat) for fn in fns])
+        elif type(struct) is list:
+            fns = [_build(s) for s in struct]
+            return lambda flat: [fn(flat) for fn in fns]
+        # Any other container type (e.g. namedtuple, OrderedDict): Let dm_tree
+        # handle the packing of its (consecutive) slice of leaves.
+        start = num_leaves
+        num_leaves += len(tree.flatten(struct))
+        end = num_leaves
+        return lambda flat: tree.unflatten_as(struct, flat[start:end])
+
+    return _build(structure)
+
+
 @DeveloperAPI
 def batch(
     list_of_structs: List[Any],
@@ -352,7 +610,8 @@ def batch(
             concatenate (instead of stack) at the end. In the example above, this would
             look like this: Input: [{"a": [1], "b": ([4], [7.0])}, ...] -> Output: same
             as in above example.
-            If the special value "auto" is used,
+            If the special value "auto" is used, checks whether the first leaf of
+            the first item has been marked as batched (see `mark_batched()`).
 
     Returns:
         The struct of component batches. Each leaf item in this struct represents the
@@ -363,21 +622,60 @@ def batch(
     if not list_of_structs:
         raise ValueError("Input `list_of_structs` does not contain any items.")
 
+    # All items must have the same structure (as `tree.map_structure` would
+    # require).
+    for s in list_of_structs[1:]:
+        tree.assert_same_structure(list_of_structs[0], s)
+
+    # Flatten each item only once and group the leaves by their position in the
+    # struct (instead of re-traversing all structs via `tree.map_structure`).
+    flat_items = [tree.flatten(s) for s in list_of_structs]
+
     # TODO (sven): Maybe replace this by a list-override (usage of which indicated
     #  this method that concatenate should be used (not stack)).
     if individual_items_already_have_batch_dim == "auto":
-        flat = tree.flatten(list_of_structs[0])
-        individual_items_already_have_batch_dim = isinstance(flat[0], BatchedNdArray)
+        individual_items_already_have_batch_dim = is_batched(flat_items[0][0])
+
+    # Note that `np.stack` and `np.concatenate` preserve the memory layout of their
+    # inputs (e.g. Fortran-ordered items), hence the `np.ascontiguousarray` (which
+    # doesn't copy already C-contiguous results).
+    if individual_items_already_have_batch_dim:
+        ret = [
+            np.ascontiguousarray(np.concatenate(leaves, axis=0))
+            for leaves in zip(*flat_items)
+        ]
+    else:
+        ret = [np.ascontiguousarray(_stack(leaves)) for leaves in zip(*flat_items)]
+    return _get_unflatten_fn(list_of_structs[0])(ret)
 
-    np_func = np.concatenate if individual_items_already_have_batch_dim else np.stack
-    ret = tree.map_structure(
-        lambda *s: np.ascontiguousarray(np_func(s, axis=0)), *list_of_structs
-    )
-    return ret
+
+def _stack(leaves: Sequence[Any]) -> np.ndarray:
+    """Faster drop-in replacement for `np.stack(leaves, axis=0)`.
+
+    `np.stack` inserts the new axis into each single item at the python level.
+    For the most common leaves (python/numpy scalars and plain ndarrays of equal
+    shape), `np.array` builds the exact same result entirely in C. Whether this fast
+    path applies is decided by the type of the first item, all other leaves fall back
+    to `np.stack`, which also produces the proper errors for mismatching shapes.
+    """
+    first = leaves[0]
+    if type(first) is np.ndarray or isinstance(first, (int, float, np.generic)):
+        try:
+            ret = np.array(leaves)
+        except ValueError:
+            ret = None
+        # Make sure all items had the same shape and no object array was created.
+        if (
+            ret is not None
+            and ret.dtype != object
+            and ret.shape == (len(leaves),) + np.shape(first)
+        ):
+            return ret
+    return np.stack(leaves, axis=0)
 
 
 @DeveloperAPI
-def unbatch(batches_struct):
+def unbatch(batches_struct, *, keepdims: bool = False):
     """Converts input from (nested) struct of batches to batch of structs.
 
     Input: Struct of different batches (each batch has size=3):
@@ -399,22 +697,128 @@ def unbatch(batches_struct):
             (in case struct is tuple/dict).
             Alternatively, `batches_struct` may also simply be a batch of
             primitives (non tuple/dict).
+        keepdims: If True, keep the batch dimension (of size 1) in all leaves of the
+            returned structs, e.g. `{"a": np.array([1]), ...}` instead of
+            `{"a": 1, ...}`. The leaves are then (size 1) slices of, and thus views
+            into, the original batches.
 
     Returns:
         The list of individual structs. Each item in the returned list represents a
         single (maybe complex) batch item.
     """
     flat_batches = tree.flatten(batches_struct)
+    batch_size = _get_batch_size(flat_batches)
+    if keepdims:
+        flat_batches = [
+            [flat_batch[i : i + 1] for i in range(batch_size)]
+            for flat_batch in flat_batches
+        ]
+    # Traverse the struct only once, then re-use the resulting packing function for
+    # all individual batch items. `zip` yields the (flat) batch items column-wise,
+    # w/o any per-leaf indexing in python.
+    unflatten = _get_unflatten_fn(batches_struct)
+
+    return [unflatten(flat_item) for flat_item in zip(*flat_batches)]
+
+
+def _get_batch_size(flat_batches: List[Any]) -> int:
+    # Returns the (common) size of all given component batches (0 if there are
+    # none).
+    if not flat_batches:
+        return 0
+    batch_size = len(flat_batches[0])
+    if any(len(flat_batch) != batch_size for flat_batch in flat_batches):
+        raise ValueError(
+            "All component batches must have the same size! Got sizes "
+            f"{[len(flat_batch) for flat_batch in flat_batches]}."
+        )
+    return batch_size
+
+
+@DeveloperAPI
+class UnbatchedView:
+    """A lazy view onto a single item of a (nested) struct of batches.
 
-    out = []
-    for batch_pos in range(len(flat_batches[0])):
-        out.append(
-            tree.unflatten_as(
-                batches_struct,
-                [flat_batches[i][batch_pos] for i in range(len(flat_batches))],
+    Other than the structs returned by `unbatch()`, an `UnbatchedView` initially
+    does not hold any (nested) dicts/tuples of its own. It only points to the
+    flattened, column-wise batches and the position of its item within these. The
+    actual (nested) struct is only built upon the first access (and then kept).
+
+    .. testcode::
+        :skipif: True
+
+        views = list(iter_unbatched({"a": np.array([1, 2]), "b": np.array([3, 4])}))
+        print(views[1]["b"])
+        print(views[0].to_struct())
+
+    .. testoutput::
+
+        4
+        {'a': 1, 'b': 3}
+    """
+
+    __slots__ = ("_flat_batches", "_unflatten", "_batch_pos", "_struct")
+
+    def __init__(
+        self,
+        flat_batches: List[Any],
+        unflatten: Callable[[List[Any]], Any],
+        batch_pos: int,
+    ):
+        """Initializes an UnbatchedView instance.
+
+        Args:
+            flat_batches: The flattened list of component batches.
+            unflatten: The function to pack a flat list of leaves into the
+                original (nested) struct (see `_get_unflatten_fn()`).
+            batch_pos: The position of the viewed item within the batches.
+        """
+        self._flat_batches = flat_batches
+        self._unflatten = unflatten
+        self._batch_pos = batch_pos
+        # The (nested) struct, built upon first access.
+        self._struct = None
+
+    def to_struct(self) -> Any:
+        """Returns the (nested) struct of this view's single batch item.
+
+        The struct is only built once (upon the first access to this view) and then
+        returned again by all subsequent calls.
+        """
+        if self._struct is None:
+            self._struct = self._unflatten(
+                [flat_batch[self._batch_pos] for flat_batch in self._flat_batches]
             )
-        )
-    return out
+        return self._struct
+
+    def __getitem__(self, key):
+        return self.to_struct()[key]
+
+
+@DeveloperAPI
+def iter_unbatched(batches_struct) -> Iterator[UnbatchedView]:
+    """Lazy version of `unbatch()`, yielding one `UnbatchedView` per batch item.
+
+    Use this instead of `unbatch()` if the individual items are consumed right
+    away (e.g. one after the other in an env stepping loop) or only some of them
+    are needed, such that no (nested) struct has to be built for items that are
+    never accessed.
+
+    Args:
+        batches_struct: The struct of component batches. Each leaf item
+            in this struct represents the batch for a single component
+            (in case struct is tuple/dict).
+            Alternatively, `batches_struct` may also simply be a batch of
+            primitives (non tuple/dict).
+
+    Yields:
+        One `UnbatchedView` per (maybe complex) batch item.
+    """
+    flat_batches = tree.flatten(batches_struct)
+    batch_size = _get_batch_size(flat_batches)
+    unflatten = _get_unflatten_fn(batches_struct)
+    for batch_pos in range(batch_size):
+        yield UnbatchedView(flat_batches, unflatten, batch_pos)
 
 
 @DeveloperAPI
@@ -434,12 +838,28 @@ def clip_action(action, action_space):
             bounds.
     """
 
-    def map_(a, s):
-        if isinstance(s, gym.spaces.Box):
-            a = np.clip(a, s.low, s.high)
-        return a
+    return apply_action_postprocess(action, action_space, unsquash=False, clip=True)
+
+
+def _get_box_scale_and_offset(space: gym.spaces.Box):
+    """Returns the (cached) affine parameters to (un)squash values of a Box space.
+
+    Unsquashing maps a value `a` in [-1.0, 1.0] to `a * scale + offset`, normalizing
+    is the inverse of that. Both parameters are computed only once per Box and then
+    stored on the space object itself (spaces don't change during training).
 
-    return tree.map_structure(map_, action, action_space)
+    Args:
+        space: The (float) Box space to get the parameters for.
+
+    Returns:
+        Tuple of `scale` ((high - low) / 2) and `offset` (low + scale).
+    """
+    params = getattr(space, "_rllib_scale_and_offset", None)
+    if params is None:
+        scale = (space.high - space.low) / 2.0
+        params = (scale, space.low + scale)
+        space._rllib_scale_and_offset = params
+    return params
 
 
 @DeveloperAPI
@@ -464,26 +884,76 @@ def unsquash_action(action, action_space_struct):
             environment (`BaseEnv.send_actions([unsquashed actions])`).
     """
 
-    def map_(a, s):
-        if (
-            isinstance(s, gym.spaces.Box)
-            and np.all(s.bounded_below)
-            and np.all(s.bounded_above)
-        ):
-            if s.dtype == np.float32 or s.dtype == np.float64:
-                # Assuming values are roughly between -1.0 and 1.0 ->
-                # unsquash them to the given bounds.
-                a = s.low + (a + 1.0) * (s.high - s.low) / 2.0
-                # Clip to given bounds, just in case the squashed values were
-                # outside [-1.0, 1.0].
-                a = np.clip(a, s.low, s.high)
-            elif np.issubdtype(s.dtype, np.integer):
-                # For Categorical and MultiCategorical actions, shift the selection
-                # into the proper range.
-                a = s.low + a
+    return apply_action_postprocess(
+        action, action_space_struct, unsquash=True, clip=False
+    )
+
+
+@DeveloperAPI
+def apply_action_postprocess(
+    action, action_space_struct, *, unsquash: bool = True, clip: bool = True
+):
+    """Unsquashes and/or clips all components in `action` in a single pass.
+
+    Same as `clip_action(unsquash_action(action, struct), struct)` (or only one of
+    the two), but each component is processed only once. Float Box components are
+    clipped right away as part of unsquashing, integer Box components are clipped
+    in-place after their shift into the Space's bounds. Only applies to Box
+    components within the action space.
+
+    Args:
+        action: The action to be post-processed. This could be any complex
+            action, e.g. a dict or tuple.
+        action_space_struct: The action space struct,
+            e.g. `{"a": Box()}` for a space: Dict({"a": Box()}).
+        unsquash: Whether to unsquash the action components (see
+            `unsquash_action()`).
+        clip: Whether to clip the action components to the Space's bounds (see
+            `clip_action()`).
+
+    Returns:
+        Any: The input action, but unsquashed and/or clipped, according to the
+            space's bounds.
+    """
+    tree.assert_same_structure(action, action_space_struct)
+    processed = [
+        _postprocess_action_component(a, s, unsquash, clip)
+        for a, s in zip(tree.flatten(action), tree.flatten(action_space_struct))
+    ]
+    return _get_unflatten_fn(action)(processed)
+
+
+def _postprocess_action_component(a, s, unsquash: bool, clip: bool):
+    if not isinstance(s, gym.spaces.Box):
         return a
 
-    return tree.map_structure(map_, action, action_space_struct)
+    if unsquash and np.all(s.bounded_below) and np.all(s.bounded_above):
+        if s.dtype == np.float32 or s.dtype == np.float64:
+            # Assuming values are roughly between -1.0 and 1.0 ->
+            # unsquash them to the given bounds via `a * scale + offset`, which
+            # is the same as `low + (a + 1.0) * (high - low) / 2.0`. Only the
+            # first op allocates, all following ones work in-place on its result.
+            scale, offset = _get_box_scale_and_offset(s)
+            a = a * scale
+            a += offset
+            # Clip to given bounds, just in case the squashed values were
+            # outside [-1.0, 1.0].
+            return np.clip(
+                a, s.low, s.high, out=a if isinstance(a, np.ndarray) else None
+            )
+        elif np.issubdtype(s.dtype, np.integer):
+            # For Categorical and MultiCategorical actions, shift the selection
+            # into the proper range.
+            a = s.low + a
+            if clip:
+                a = np.clip(
+                    a, s.low, s.high, out=a if isinstance(a, np.ndarray) else None
+                )
+            return a
+
+    if clip:
+        a = np.clip(a, s.low, s.high)
+    return a
 
 
 @DeveloperAPI
@@ -511,12 +981,62 @@ def normalize_action(action, action_space_struct):
             s.dtype == np.float32 or s.dtype == np.float64
         ):
             # Normalize values to be exactly between -1.0 and 1.0.
-            a = ((a - s.low) * 2.0) / (s.high - s.low) - 1.0
+            scale, offset = _get_box_scale_and_offset(s)
+            a = a - offset
+            a /= scale
         return a
 
     return tree.map_structure(map_, action, action_space_struct)
 
 
+def _convert_to_ndarray_element(elem, s):
+    if not isinstance(elem, np.ndarray):
+        assert isinstance(
+            elem, (float, int)
+        ), f"ERROR: `elem` ({elem}) must be np.array, float or int!"
+        if s.shape == ():
+            elem = np.array(elem, dtype=s.dtype)
+        else:
+            raise ValueError(
+                "Element should be of type np.ndarray but is instead of \
+                    type {}".format(
+                    type(elem)
+                )
+            )
+    elif s.dtype != elem.dtype:
+        elem = elem.astype(s.dtype)
+    return elem
+
+
+def _convert_to_int_element(elem, s):
+    if isinstance(elem, float) and elem.is_integer():
+        elem = int(elem)
+    # Note: This does not check if the float element is actually an integer
+    if isinstance(elem, np.float_):
+        elem = np.int64(elem)
+    return elem
+
+
+@functools.lru_cache(maxsize=None)
+def _get_element_converter(sampled_element_type: type) -> Callable[[Any, Any], Any]:
+    """Returns the function converting elements to the given sampled element's type.
+
+    The lookup is done only once per (sampled element) type, such that
+    `convert_element_to_space_type()` doesn't have to go through a chain of
+    `isinstance` checks for each single leaf.
+    """
+    if issubclass(sampled_element_type, np.ndarray):
+        return _convert_to_ndarray_element
+    # Gymnasium now uses np.int_64 as the dtype of a Discrete action space
+    elif issubclass(sampled_element_type, (int, np.int_)):
+        return _convert_to_int_element
+    return _keep_element
+
+
+def _keep_element(elem, s):
+    return elem
+
+
 @DeveloperAPI
 def convert_element_to_space_type(element: Any, sampled_element: Any) -> Any:
     """Convert all the components of the element to match the space dtypes.
@@ -531,32 +1051,9 @@ def convert_element_to_space_type(element: Any, sampled_element: Any) -> Any:
         the space dtypes.
     """
 
-    def map_(elem, s):
-        if isinstance(s, np.ndarray):
-            if not isinstance(elem, np.ndarray):
-                assert isinstance(
-                    elem, (float, int)
-                ), f"ERROR: `elem` ({elem}) must be np.array, float or int!"
-                if s.shape == ():
-                    elem = np.array(elem, dtype=s.dtype)
-                else:
-                    raise ValueError(
-                        "Element should be of type np.ndarray but is instead of \
-                            type {}".format(
-                            type(elem)
-                        )
-                    )
-            elif s.dtype != elem.dtype:
-                elem = elem.astype(s.dtype)
-
-        # Gymnasium now uses np.int_64 as the dtype of a Discrete action space
-        elif isinstance(s, int) or isinstance(s, np.int_):
-            if isinstance(elem, float) and elem.is_integer():
-                elem = int(elem)
-            # Note: This does not check if the float element is actually an integer
-            if isinstance(elem, np.float_):
-                elem = np.int64(elem)
-
-        return elem
-
-    return tree.map_structure(map_, element, sampled_element, check_types=False)
+    tree.assert_same_structure(element, sampled_element, check_types=False)
+    converted = [
+        _get_element_converter(type(s))(elem, s)
+        for elem, s in zip(tree.flatten(element), tree.flatten(sampled_element))
+    ]
+    return _get_unflatten_fn(element)(converted)
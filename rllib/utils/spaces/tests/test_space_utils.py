@@ -1,5 +1,6 @@
 """Test utils in rllib/utils/space_utils.py."""
 
+import json
 import unittest
 
 from gymnasium.spaces import Box, Discrete, MultiDiscrete, MultiBinary, Tuple, Dict
@@ -7,12 +8,22 @@ import numpy as np
 import tree  # pip install dm_tree
 
 from ray.rllib.utils.spaces.space_utils import (
+    apply_action_postprocess,
     batch,
+    clip_action,
     convert_element_to_space_type,
+    flatten_space,
     get_base_struct_from_space,
+    get_dummy_batch_for_space,
+    is_batched,
+    iter_unbatched,
+    mark_batched,
+    normalize_action,
+    to_jsonable_if_needed,
     unbatch,
     unsquash_action,
 )
+from ray.rllib.utils.spaces.flexdict import FlexDict
 from ray.rllib.utils.test_utils import check
 
 
@@ -60,6 +71,181 @@ class TestSpaceUtils(unittest.TestCase):
         )
         assert dict_space.contains(element_with_correct_types)
 
+    def test_flatten_space(self):
+        """Tests `flatten_space` incl. the caching of its results."""
+        space = Dict(
+            {
+                "b": Tuple((Discrete(2), Box(-1.0, 1.0, (2,)))),
+                "a": MultiDiscrete([2, 3]),
+            }
+        )
+        expected = [MultiDiscrete([2, 3]), Discrete(2), Box(-1.0, 1.0, (2,))]
+        flat = flatten_space(space)
+        self.assertEqual(flat, expected)
+        # Altering the returned list must not affect the (cached) result.
+        flat.append(Discrete(5))
+        self.assertEqual(flatten_space(space), expected)
+
+        # (Flex)Dicts can be altered -> Results must reflect the changes.
+        for space in [FlexDict({"a": Discrete(2)}), Dict({"a": Discrete(2)})]:
+            self.assertEqual(flatten_space(space), [Discrete(2)])
+            space["b"] = Discrete(3)
+            self.assertEqual(flatten_space(space), [Discrete(2), Discrete(3)])
+        # Also, if the altered Dict is nested inside another space.
+        space = Tuple((Discrete(2), Dict({"a": Discrete(3)})))
+        self.assertEqual(flatten_space(space), [Discrete(2), Discrete(3)])
+        space[1]["b"] = Discrete(4)
+        self.assertEqual(flatten_space(space), [Discrete(2), Discrete(3), Discrete(4)])
+
+    def test_get_base_struct_from_space(self):
+        """Tests `get_base_struct_from_space` incl. the caching of its results."""
+        space = Dict({"a": Discrete(2), "b": Tuple((Box(-1.0, 1.0), Discrete(3)))})
+        struct = get_base_struct_from_space(space)
+        self.assertEqual(
+            struct,
+            {"a": Discrete(2), "b": (Box(-1.0, 1.0), Discrete(3))},
+        )
+        # Same (cached) struct should be returned for the same space.
+        self.assertIs(get_base_struct_from_space(space), struct)
+        # Primitive spaces are returned as-is.
+        self.assertIs(get_base_struct_from_space(space["a"]), space["a"])
+
+        # (Flex)Dicts can be altered -> Results must reflect the changes.
+        for space in [FlexDict({"a": Discrete(2)}), Dict({"a": Discrete(2)})]:
+            self.assertEqual(get_base_struct_from_space(space), {"a": Discrete(2)})
+            space["b"] = Discrete(3)
+            self.assertEqual(
+                get_base_struct_from_space(space),
+                {"a": Discrete(2), "b": Discrete(3)},
+            )
+
+    def test_get_dummy_batch_for_space_random(self):
+        """Tests random dummy batches (shapes, dtypes, and bounds)."""
+        for space in [
+            Box(-1.0, 1.0, (2,), np.float32),
+            Box(0, 5, (3,), np.int32),
+            Discrete(3, start=2),
+            MultiDiscrete([2, 3]),
+        ]:
+            for kwargs, leading_dims in [
+                ({"batch_size": 0}, ()),
+                ({"batch_size": 4}, (4,)),
+                ({"batch_size": 4, "time_size": 3}, (4, 3)),
+                ({"batch_size": 4, "time_size": 3, "time_major": True}, (3, 4)),
+            ]:
+                dummy = get_dummy_batch_for_space(space, fill_value="random", **kwargs)
+                self.assertIsInstance(dummy, np.ndarray)
+                self.assertEqual(dummy.shape, leading_dims + space.shape)
+                self.assertEqual(dummy.dtype, space.dtype)
+                for item in dummy.reshape((-1,) + space.shape):
+                    self.assertTrue(space.contains(item))
+
+        # Integer Boxes: Values must come in the space's own dtype and cover the
+        # entire (inclusive) [low, high] range.
+        space = Box(0, 255, (8, 8, 3), np.uint8)
+        dummy = get_dummy_batch_for_space(space, 256, fill_value="random")
+        self.assertEqual(dummy.dtype, np.uint8)
+        self.assertTrue(all(space.contains(item) for item in dummy))
+        self.assertEqual((dummy.min(), dummy.max()), (0, 255))
+        # Different bounds per component.
+        space = Box(np.array([-3, 0]), np.array([-1, 1]), (2,), np.int64)
+        dummy = get_dummy_batch_for_space(space, 256, fill_value="random")
+        self.assertEqual(dummy.dtype, np.int64)
+        self.assertTrue(all(space.contains(item) for item in dummy))
+        check(dummy.min(axis=0), [-3, 0])
+        check(dummy.max(axis=0), [-1, 1])
+
+        # Very large (but finite) bounds, whose range overflows the space's dtype.
+        for dtype in [np.float32, np.float64]:
+            max_ = np.finfo(dtype).max if dtype == np.float32 else 1e307
+            space = Box(-max_, max_, (3,), dtype)
+            dummy = get_dummy_batch_for_space(space, 100, fill_value="random")
+            self.assertTrue(np.all(np.isfinite(dummy)))
+            self.assertTrue(np.all(dummy < max_) and np.all(dummy > -max_))
+            self.assertTrue(all(space.contains(item) for item in dummy))
+
+    def test_to_jsonable_if_needed(self):
+        """Tests `to_jsonable_if_needed` against gymnasium's own `to_jsonable`.
+
+        Note that `to_jsonable_if_needed` re-implements gymnasium's `to_jsonable`
+        output for some space types. This test makes sure both stay in sync, e.g.
+        after a gymnasium upgrade.
+        """
+        # All space types handled directly by `to_jsonable_if_needed`.
+        leaf_spaces = [
+            Box(-1.0, 1.0, (2, 2)),
+            Box(0, 5, (3,), np.int32),
+            Box(-1.0, 1.0, ()),
+            Discrete(3),
+            Discrete(3, start=-1),
+            MultiBinary(3),
+            MultiBinary([2, 2]),
+            MultiDiscrete([2, 3]),
+            MultiDiscrete([[2, 3], [4, 5]]),
+        ]
+        spaces = (
+            [Tuple([s]) for s in leaf_spaces]
+            + [Dict({"a": s}) for s in leaf_spaces]
+            + [
+                Tuple(leaf_spaces),
+                Tuple((Tuple((Discrete(2), Box(-1.0, 1.0))), Tuple(leaf_spaces))),
+                Dict({"a": Tuple((Discrete(2), Tuple(leaf_spaces)))}),
+                Dict(
+                    {
+                        "a": Tuple((Discrete(3), MultiBinary(3))),
+                        "b": Box(-1.0, 1.0, (2, 2)),
+                        "c": Dict({"d": Discrete(2), "e": Box(0.0, 1.0, (3,))}),
+                    }
+                ),
+                # Other (e.g. composite) sub-spaces use their own `to_jsonable`.
+                Tuple((Discrete(2), Tuple([Discrete(2)] * 2), FlexDict({}))),
+            ]
+        )
+        for space in spaces:
+            space.seed(42)
+            for _ in range(3):
+                sample = space.sample()
+                # Compare the actual JSON strings (this also makes sure that no
+                # numpy types are left over in our output).
+                self.assertEqual(
+                    json.dumps(to_jsonable_if_needed(sample, space)),
+                    json.dumps(space.to_jsonable([sample])),
+                )
+        # Dict spaces can be altered -> Results must reflect the changes (also for
+        # nested Dicts).
+        space = Dict({"a": Discrete(2), "b": Tuple((Dict({"c": Discrete(3)}),))})
+        sample = space.sample()
+        self.assertEqual(
+            to_jsonable_if_needed(sample, space), space.to_jsonable([sample])
+        )
+        space["d"] = Discrete(5)
+        space["b"][0]["e"] = MultiBinary(2)
+        sample = space.sample()
+        self.assertEqual(
+            json.dumps(to_jsonable_if_needed(sample, space)),
+            json.dumps(space.to_jsonable([sample])),
+        )
+
+        # Non-composite spaces: Samples are returned as-is.
+        for space in leaf_spaces:
+            sample = space.sample()
+            self.assertIs(to_jsonable_if_needed(sample, space), sample)
+
+    def test_clip_action(self):
+        """Tests whether `clip_action` only clips the Box components of an action."""
+        space = Dict(
+            {
+                "b": Box(low=-1.0, high=1.0, shape=(2,)),
+                "a": Tuple((Discrete(5), Box(low=0.0, high=2.0, shape=()))),
+            }
+        )
+        struct = get_base_struct_from_space(space)
+        action = {"b": np.array([-2.0, 0.5]), "a": (7, np.array(3.0))}
+        clipped = clip_action(action, struct)
+        check(clipped, {"b": np.array([-1.0, 0.5]), "a": (7, np.array(2.0))})
+        # Key order of the returned dict should be the one of the given action.
+        self.assertEqual(list(clipped.keys()), ["b", "a"])
+
     def test_unsquash_action(self):
         """Test to make sure unsquash_action works for both float and int Box spaces."""
         space = Box(low=3, high=8, shape=(2,), dtype=np.float32)
@@ -74,6 +260,51 @@ class TestSpaceUtils(unittest.TestCase):
         self.assertEqual(action[0], 6)
         self.assertEqual(action[1], 6)
 
+    def test_normalize_and_unsquash_action(self):
+        """Tests whether `normalize_action` and `unsquash_action` are inverses."""
+        space = Dict(
+            {
+                "a": Box(low=-2.0, high=4.0, shape=(3,), dtype=np.float32),
+                "b": Tuple((Box(-1.0, 1.0, (), np.float64), Discrete(3))),
+            }
+        )
+        struct = get_base_struct_from_space(space)
+        action = {
+            "a": np.array([-1.0, 0.0, 1.0], np.float32),
+            "b": (np.array(0.5), 2),
+        }
+        unsquashed = unsquash_action(action, struct)
+        check(unsquashed["a"], [-2.0, 1.0, 4.0])
+        check(unsquashed["b"], (0.5, 2))
+        # The input action should not be altered.
+        check(action["a"], [-1.0, 0.0, 1.0])
+        check(normalize_action(unsquashed, struct), action)
+
+        # Out-of-bounds values should be clipped after unsquashing.
+        action = {"a": np.array([-3.0, 2.0, 0.5]), "b": (0.0, 0)}
+        check(unsquash_action(action, struct)["a"], [-2.0, 4.0, 2.5])
+
+    def test_apply_action_postprocess(self):
+        """Tests unsquashing and clipping actions in one go."""
+        struct = get_base_struct_from_space(
+            Tuple(
+                (
+                    Box(low=-2.0, high=2.0, shape=(2,), dtype=np.float32),
+                    Box(low=3, high=8, shape=(2,), dtype=np.int32),
+                )
+            )
+        )
+        action = (np.array([-1.5, 0.5]), np.array([1, 7]))
+        check(
+            apply_action_postprocess(action, struct),
+            (np.array([-2.0, 1.0]), np.array([4, 8])),
+        )
+        # Same as calling `unsquash_action`, then `clip_action`.
+        check(
+            apply_action_postprocess(action, struct),
+            clip_action(unsquash_action(action, struct), struct),
+        )
+
     def test_batch_and_unbatch_simple(self):
         """Tests the two utility functions `batch` and `unbatch`."""
         # Test, whether simple structs are batch/unbatch'able.
@@ -82,6 +313,29 @@ class TestSpaceUtils(unittest.TestCase):
         simple_struct_batched = batch(simple_struct)
         check(unbatch(simple_struct_batched), simple_struct)
 
+        # Items with different shapes cannot be stacked.
+        with self.assertRaises(ValueError):
+            batch([np.array([0, 1]), np.array([2])])
+        with self.assertRaises(ValueError):
+            batch([0, np.array([1, 2])])
+        # Items with different structures cannot be batched.
+        with self.assertRaises(ValueError):
+            batch([{"a": 1}, {"b": 2}])
+        with self.assertRaises(ValueError):
+            batch([{"a": 1, "b": (2, 3)}, {"a": 4, "b": (5,)}])
+        with self.assertRaises(TypeError):
+            batch([{"a": 1, "b": 2}, (3, 4)])
+
+        # Batched results are always C-contiguous (even for Fortran-ordered items).
+        item = np.asfortranarray(np.ones((3, 4)))
+        self.assertTrue(batch([item, item]).flags.c_contiguous)
+        self.assertTrue(
+            batch(
+                [mark_batched(item), mark_batched(item)],
+                individual_items_already_have_batch_dim="auto",
+            ).flags.c_contiguous
+        )
+
         # Test, whether simple structs that are already batched are
         # batch/unbatch'able.
         # B=1 or 2
@@ -94,6 +348,15 @@ class TestSpaceUtils(unittest.TestCase):
         # had arrays in them of different batch dims.
         check(unbatch(simple_struct_batched), [0, 1, 2, 3, 4, 5])
 
+        # Let `batch` figure out itself, whether the items are already batched.
+        simple_struct = [mark_batched([0]), mark_batched([1, 2]), mark_batched([3])]
+        self.assertTrue(all(is_batched(s) for s in simple_struct))
+        check(
+            batch(simple_struct, individual_items_already_have_batch_dim="auto"),
+            np.array([0, 1, 2, 3]),
+        )
+        self.assertFalse(is_batched(np.array([0, 1])))
+
         # Create a complex struct of individual batches (B=2).
         complex_struct = {
             "a": (
@@ -123,6 +386,33 @@ class TestSpaceUtils(unittest.TestCase):
             ],
         )
 
+        # Lazy unbatching should yield the same items.
+        views = list(iter_unbatched(complex_struct))
+        check([v.to_struct() for v in views], complex_struct_unbatched)
+        check(views[1]["c"], complex_struct_unbatched[1]["c"])
+        # The view's struct is only built once.
+        self.assertIs(views[1]["c"], views[1]["c"])
+
+        # All component batches must have the same size.
+        with self.assertRaises(ValueError):
+            unbatch({"a": np.arange(3), "b": np.arange(2)})
+        with self.assertRaises(ValueError):
+            list(iter_unbatched({"a": np.arange(3), "b": np.arange(2)}))
+        # Empty structs don't have any batch items.
+        self.assertEqual(unbatch({}), [])
+        self.assertEqual(list(iter_unbatched({})), [])
+
+        # Unbatching w/ `keepdims=True` should keep a batch dim of 1 in all leaves.
+        complex_struct_unbatched_keepdims = unbatch(complex_struct, keepdims=True)
+        check(
+            complex_struct_unbatched_keepdims,
+            [
+                tree.map_structure(lambda s: s[0:1], complex_struct),
+                tree.map_structure(lambda s: s[1:2], complex_struct),
+            ],
+        )
+        self.assertEqual(unbatch(np.zeros((0, 2)), keepdims=True), [])
+
         # Re-batch the unbatched struct.
         complex_struct_rebatched = batch(complex_struct_unbatched)
         # Should be identical to original struct.